@@ -2,7 +2,7 @@
 
 This module is responsible for injecting a 'docker-compose.yml' file into the
 repository of the Data Manager Job repository under test. It also
-created project and instance directories, and executes 'docker-compose up'
+created project and instance directories, and executes 'docker-compose run'
 to run the Job, and can remove the test directory.
 
 This module is designed to simulate the actions of the Data Manager
@@ -12,11 +12,18 @@ and Job Operator that are running in the DM kubernetes deployment.
 import contextlib
 import copy
 import os
+import re
+import shlex
 import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, Union
 
 # The 'simulated' instance directory,
 # created by the Data Manager prior to launching the corresponding Job.
@@ -27,10 +34,32 @@ INSTANCE_DIRECTORY: str = ".instance-88888888-8888-8888-8888-888888888888"
 # A default test execution timeout (minutes)
 DEFAULT_TEST_TIMEOUT_M: int = 10
 
-# The docker-compose file template.
-# A multi-line string with variable mapping,
-# expanded and written to the test directory in 'create()'.
-_COMPOSE_CONTENT: str = """---
+# The docker compose project name used for grouped tests.
+# Grouped tests share this project (and its 'data-manager_jote' network)
+# with any containers started from the test group's compose file.
+GROUP_PROJECT_NAME: str = "data-manager"
+
+
+def _render_compose(
+    *,
+    image: str,
+    container_name: str,
+    uid: int,
+    gid: int,
+    command: str,
+    working_directory: str,
+    test_path: str,
+    project_directory: str,
+    memory_limit: str,
+    cpus: int,
+    instance_directory: str,
+    additional_environment: str,
+) -> str:
+    """Returns the docker-compose file content for a test.
+    The content's shape is fixed, only the values vary, so it's
+    a simple f-string rather than a template that has to be parsed.
+    """
+    return f"""---
 # We use compose v2
 # because we're relying on 'mem_limit' and 'cpus',
 # which are ignored (moved to swarm) in v3.
@@ -42,7 +71,7 @@ services:
     networks:
     - jote
     image: {image}
-    container_name: {job}-{test}-jote
+    container_name: {container_name}
     user: '{uid}:{gid}'
     entrypoint: {command}
     command: []
@@ -56,18 +85,91 @@ services:
     - DM_INSTANCE_DIRECTORY={instance_directory}
 {additional_environment}"""
 
+
+# The variable references docker compose substitutes in a compose file's values:
+# '$$' (a literal '$'), '$VAR', '${VAR}' and '${VAR}' with a default ('-'),
+# alternative ('+') or error message ('?'), optionally prefixed with ':'
+# (which also applies it when the variable is empty).
+_INTERPOLATION_RE: re.Pattern[str] = re.compile(
+    r"""\$(?:
+        (?P<escaped>\$)
+        |(?P<named>[_a-zA-Z][_a-zA-Z0-9]*)
+        |\{(?P<braced>[_a-zA-Z][_a-zA-Z0-9]*)
+            (?:(?P<operator>:?[-+?])(?P<argument>[^}]*))?\}
+        |(?P<invalid>)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _interpolate(text: str, environment: Dict[str, str]) -> str:
+    """Substitutes variables in a value, as docker compose does for the values
+    in a compose file. An unset variable is replaced by an empty string.
+    A ValueError is raised for an invalid reference or a missing
+    required ('?') variable.
+    """
+
+    def substitute(match: re.Match[str]) -> str:
+        if match.group("escaped"):
+            return "$"
+        name: Optional[str] = match.group("named") or match.group("braced")
+        if name is None:
+            raise ValueError(f"Invalid interpolation format in '{text}'")
+        value: str = environment.get(name, "")
+        operator: Optional[str] = match.group("operator")
+        if not operator:
+            return value
+        is_set: bool = name in environment and (
+            not operator.startswith(":") or value != ""
+        )
+        argument: str = match.group("argument")
+        if operator.endswith("-"):
+            return value if is_set else argument
+        if operator.endswith("+"):
+            return argument if is_set else ""
+        if not is_set:
+            raise ValueError(
+                f"Required variable '{name}' is missing a value: {argument}"
+            )
+        return value
+
+    return _INTERPOLATION_RE.sub(substitute, text)
+
+
+# Command output is collected in spooled temporary files.
+# These are kept in memory until they exceed this size (bytes),
+# and are then written to disk.
+_SPOOL_MAX_SIZE: int = 1 << 20
+# The size of each read from a command's stdout and stderr.
+_SPOOL_READ_SIZE: int = 1 << 16
+
+# The process groups of the commands 'run_captured()' is running.
+# Each command runs in its own session, so a Ctrl-C at the terminal
+# does not reach it - we pass interrupts on ourselves.
+_RUNNING_PROCESS_GROUPS: Set[int] = set()
+_RUNNING_PROCESS_GROUPS_LOCK: threading.Lock = threading.Lock()
+# How long (seconds) an interrupted command has to finish
+# before it's killed.
+_INTERRUPT_GRACE_S: float = 10
+
+# Timeouts (seconds) for checking and pulling test images.
+_IMAGE_INSPECT_TIMEOUT_S: float = 60
+_IMAGE_PULL_TIMEOUT_S: float = 600
+
 _NF_CONFIG_CONTENT: str = """
 docker.enabled = true
 docker.runOptions = '-u $(id -u):$(id -g)'
 """
 
 
-def _get_docker_compose_command() -> str:
+def _get_docker_compose_command() -> Tuple[str, str]:
+    """Returns the docker compose command and its version."""
     # Try 'docker compose' (v2) and then 'docker-compose' (v1)
     # we need one or the other.
     dc_command: str = ""
+    result: Optional[subprocess.CompletedProcess[bytes]] = None
     try:
-        _ = subprocess.run(
+        result = subprocess.run(
             ["docker", "compose", "version"],
             capture_output=True,
             check=False,
@@ -76,7 +178,7 @@ def _get_docker_compose_command() -> str:
         dc_command = "docker compose"
     except FileNotFoundError:
         with contextlib.suppress(FileNotFoundError):
-            _ = subprocess.run(
+            result = subprocess.run(
                 ["docker-compose", "version"],
                 capture_output=True,
                 check=False,
@@ -90,18 +192,257 @@ def _get_docker_compose_command() -> str:
         sys.exit(1)
 
     assert dc_command
-    return dc_command
-
-
-def _get_docker_compose_version() -> str:
-    dc_command = _get_docker_compose_command()
-    version_cmd: List[str] = dc_command.split() + ["version"]
-    result = subprocess.run(version_cmd, capture_output=True, check=False, timeout=4)
-
+    assert result
     # stdout will contain the version on the first line: -
     # "docker-compose version v1.29.2, build unknown"
     # Ignore the first 23 characters of the first line...
-    return str(result.stdout.decode("utf-8").split("\n")[0][23:])
+    version: str = str(result.stdout.decode("utf-8").split("\n")[0][23:])
+
+    return dc_command, version
+
+
+def _spool(pipe: IO[bytes], spool: IO[bytes]) -> None:
+    """Copies everything from a pipe to a spool file (until the pipe closes)."""
+    for chunk in iter(lambda: pipe.read(_SPOOL_READ_SIZE), b""):
+        spool.write(chunk)
+
+
+def _read_spool(spool: IO[bytes], output_limit: Optional[int]) -> bytes:
+    """Reads a spool file, or just its last 'output_limit' bytes."""
+    if output_limit is None:
+        _ = spool.seek(0)
+    else:
+        size: int = spool.seek(0, os.SEEK_END)
+        _ = spool.seek(max(0, size - output_limit))
+    return spool.read()
+
+
+def _signal_process_group(process_group: int, signal_number: int) -> None:
+    """Sends a signal to a process group (that may have already gone)."""
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process_group, signal_number)
+
+
+def interrupt_running_commands() -> None:
+    """Interrupts (with SIGINT, as a Ctrl-C at the terminal would)
+    all the commands that 'run_captured()' is running.
+    """
+    with _RUNNING_PROCESS_GROUPS_LOCK:
+        process_groups: List[int] = list(_RUNNING_PROCESS_GROUPS)
+    for process_group in process_groups:
+        _signal_process_group(process_group, signal.SIGINT)
+
+
+def _wait_for_process(
+    process: subprocess.Popen[bytes],
+    stdout_spool: IO[bytes],
+    stderr_spool: IO[bytes],
+    timeout: float,
+) -> int:
+    """Spools a 'run_captured()' process's output while waiting for it to finish,
+    returning its exit code.
+    """
+    assert process.stdout
+    assert process.stderr
+    spoolers: List[threading.Thread] = [
+        threading.Thread(
+            target=_spool, args=(process.stdout, stdout_spool), daemon=True
+        ),
+        threading.Thread(
+            target=_spool, args=(process.stderr, stderr_spool), daemon=True
+        ),
+    ]
+    for spooler in spoolers:
+        spooler.start()
+    try:
+        return_code: int = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _signal_process_group(process.pid, signal.SIGKILL)
+        process.wait()
+        raise
+    except KeyboardInterrupt:
+        _signal_process_group(process.pid, signal.SIGINT)
+        try:
+            process.wait(timeout=_INTERRUPT_GRACE_S)
+        except subprocess.TimeoutExpired:
+            _signal_process_group(process.pid, signal.SIGKILL)
+            process.wait()
+        raise
+    for spooler in spoolers:
+        spooler.join()
+    return return_code
+
+
+def run_captured(
+    command: Union[str, List[str]],
+    *,
+    timeout: float,
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, Any]] = None,
+    shell: bool = False,
+    output_limit: Optional[int] = None,
+) -> Tuple[int, bytes, bytes]:
+    """Runs a command, returning its exit code, stdout and stderr.
+    The output is returned undecoded, it's up to the caller to decode it
+    (if and when it needs to). If an 'output_limit' is set only the last
+    'output_limit' bytes of stdout and stderr are returned.
+
+    Unlike 'subprocess.run(capture_output=True)' the output is not accumulated
+    in memory as the command runs. Threads drain the command's stdout and stderr
+    into spooled temporary files, which move to disk if the output is large.
+    If the command does not finish within the timeout (seconds)
+    it's killed and subprocess.TimeoutExpired is raised.
+
+    The command is run in its own session (process group) so that, on a timeout,
+    we can kill it along with any processes it has started (a shell's children
+    for example). Otherwise they would keep its stdout and stderr open, and we'd
+    have to wait for them to finish. It also means a Ctrl-C at the terminal
+    does not reach it. If we're interrupted while waiting for the command
+    we interrupt it (killing it if it does not finish promptly)
+    and commands being run by other threads can be interrupted
+    with 'interrupt_running_commands()'.
+    """
+    with tempfile.SpooledTemporaryFile(
+        max_size=_SPOOL_MAX_SIZE
+    ) as stdout_spool, tempfile.SpooledTemporaryFile(
+        max_size=_SPOOL_MAX_SIZE
+    ) as stderr_spool:
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            shell=shell,
+            start_new_session=True,
+        ) as process:
+            with _RUNNING_PROCESS_GROUPS_LOCK:
+                _RUNNING_PROCESS_GROUPS.add(process.pid)
+            try:
+                return_code: int = _wait_for_process(
+                    process, stdout_spool, stderr_spool, timeout
+                )
+            finally:
+                with _RUNNING_PROCESS_GROUPS_LOCK:
+                    _RUNNING_PROCESS_GROUPS.discard(process.pid)
+
+        return (
+            return_code,
+            _read_spool(stdout_spool, output_limit),
+            _read_spool(stderr_spool, output_limit),
+        )
+
+
+def _pull_image(image: str) -> bool:
+    """Pulls a container image if it's not already available locally,
+    returning True if the image is available. A local image (one you may
+    have just built) is used as-is, it is not replaced by a pulled one.
+    An image that cannot be checked or pulled (docker is missing
+    or does not respond in time) is not available.
+    """
+    try:
+        inspect = subprocess.run(
+            ["docker", "image", "inspect", image],
+            capture_output=True,
+            check=False,
+            timeout=_IMAGE_INSPECT_TIMEOUT_S,
+        )
+        if inspect.returncode == 0:
+            return True
+        pull = subprocess.run(
+            ["docker", "pull", "--quiet", image],
+            capture_output=True,
+            check=False,
+            timeout=_IMAGE_PULL_TIMEOUT_S,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return pull.returncode == 0
+
+
+def pull_images(images: List[str], max_workers: int) -> List[str]:
+    """Pulls missing container images, concurrently, before any tests are run.
+    Without this each image is pulled (or checked) as its first test starts.
+    The images that are not available are returned.
+    """
+    if not images:
+        return []
+
+    print(f"# Compose: Pulling test images ({len(images)})...")
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        available: List[bool] = list(executor.map(_pull_image, images))
+    print("# Compose: Pulled test images")
+
+    return [image for image, ok in zip(images, available) if not ok]
+
+
+def _empty_directory(path: str) -> None:
+    """Removes the content of a directory, leaving the (empty) directory."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _remove_tree(path: str) -> None:
+    """Removes a directory tree (if it exists)."""
+    with contextlib.suppress(FileNotFoundError):
+        shutil.rmtree(path)
+
+
+class _Deletion(threading.Thread):
+    """Removes a test directory in the background,
+    keeping the error (if there is one) for when the deletion is waited on.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path: str = path
+        self.error: Optional[OSError] = None
+
+    def run(self) -> None:
+        try:
+            _remove_tree(self.path)
+        except OSError as ex:
+            self.error = ex
+
+    def wait(self) -> None:
+        """Waits for the deletion, reporting it if it failed."""
+        self.join()
+        if self.error:
+            print(
+                "# Compose: WARNING - Failed to delete the test"
+                f' ("{self.path}"): {self.error}'
+            )
+
+
+# Test directories that are being deleted (by 'Compose.delete()')
+# in the background, indexed by the directory path.
+_PENDING_DELETIONS: Dict[str, _Deletion] = {}
+_PENDING_DELETIONS_LOCK: threading.Lock = threading.Lock()
+
+
+def wait_for_deletions() -> None:
+    """Waits for any test directories that are being deleted
+    in the background.
+    """
+    with _PENDING_DELETIONS_LOCK:
+        for deletion in _PENDING_DELETIONS.values():
+            deletion.wait()
+        _PENDING_DELETIONS.clear()
+
+
+def _wait_for_deletion(path: str) -> None:
+    """Waits for a test directory that's being deleted in the background
+    (if it is). A test's directory is re-used if the test is run again
+    (i.e. it's in more than one run group).
+    """
+    with _PENDING_DELETIONS_LOCK:
+        deletion: Optional[_Deletion] = _PENDING_DELETIONS.pop(path, None)
+    if deletion:
+        deletion.wait()
 
 
 def get_test_root() -> str:
@@ -135,6 +476,7 @@ class Compose:
         test_environment: Dict[str, str],
         user_id: Optional[int] = None,
         group_id: Optional[int] = None,
+        project_name: Optional[str] = None,
     ):
         # Memory must have a Mi or Gi suffix.
         # For docker-compose we translate to 'm' and 'g'
@@ -157,6 +499,13 @@ class Compose:
         self._test_environment = copy.deepcopy(test_environment)
         self._user_id: Optional[int] = user_id
         self._group_id: Optional[int] = group_id
+        # Without an explicit project name each test gets its own compose
+        # project (and network) so that tests can be run concurrently.
+        # A short random suffix keeps the name unique, even between
+        # concurrent runs of jote.
+        self._project_name: str = (
+            project_name or f"{collection}-{job}-{test}-{uuid.uuid4().hex[:8]}"
+        )
 
         assert Compose.try_to_set_compose_command()
 
@@ -171,54 +520,56 @@ class Compose:
         return f"{test_path}/project"
 
     def create(self) -> str:
-        """Writes a docker-compose file
-        and creates the test directory structure returning the
+        """Creates the test directory structure (writing a docker-compose file
+        for grouped tests, which are run using compose) returning the
         full path to the test (project) directory.
         """
 
         print("# Compose: Creating test environment...")
 
-        # First, delete
+        # First, empty any existing project directory (from an earlier run).
+        # We keep the directories (any compose file is simply replaced)
+        # rather than remove and then re-create the whole tree.
+        # The directory may still be being deleted (in the background)
+        # so we wait for that first.
         test_path: str = self.get_test_path()
-        if os.path.exists(test_path):
-            shutil.rmtree(test_path)
+        project_path: str = self.get_test_project_path()
+        _wait_for_deletion(test_path)
+        with contextlib.suppress(FileNotFoundError):
+            _empty_directory(project_path)
 
         # Make the test directory
         # (where the test is launched from)
         # and the project directory (a /project sud-directory of test)
-        test_path = self.get_test_path()
-        project_path: str = self.get_test_project_path()
         inst_path: str = f"{project_path}/{INSTANCE_DIRECTORY}"
-        if not os.path.exists(inst_path):
-            os.makedirs(inst_path)
+        os.makedirs(inst_path, exist_ok=True)
 
-        # Run as a specific user/group ID?
-        user_id = self._user_id if self._user_id is not None else os.getuid()
-        group_id = self._group_id if self._group_id is not None else os.getgid()
-        # Write the Docker compose content to a file in the test directory
-        additional_environment: str = ""
-        if self._test_environment:
-            for e_name, e_value in self._test_environment.items():
-                additional_environment += f"    - {e_name}={e_value}\n"
-        variables: Dict[str, Any] = {
-            "command": self._command,
-            "test_path": project_path,
-            "job": self._job,
-            "test": self._test,
-            "image": self._image,
-            "memory_limit": self._memory,
-            "cpus": self._cores,
-            "uid": user_id,
-            "gid": group_id,
-            "project_directory": self._project_directory,
-            "working_directory": self._working_directory,
-            "instance_directory": INSTANCE_DIRECTORY,
-            "additional_environment": additional_environment,
-        }
-        compose_content: str = _COMPOSE_CONTENT.format(**variables)
-        compose_path: str = f"{test_path}/docker-compose.yml"
-        with open(compose_path, "wt", encoding="UTF-8") as compose_file:
-            compose_file.write(compose_content)
+        # Write the Docker compose content to a file in the test directory.
+        # Only grouped tests need one, other tests are run with 'docker run'
+        # (see '_get_run_command()').
+        if self._project_name == GROUP_PROJECT_NAME:
+            additional_environment: str = ""
+            if self._test_environment:
+                for e_name, e_value in self._test_environment.items():
+                    additional_environment += f"    - {e_name}={e_value}\n"
+            user_id, group_id = self._get_user()
+            compose_content: str = _render_compose(
+                image=self._image,
+                container_name=self._get_container_name(),
+                uid=user_id,
+                gid=group_id,
+                command=self._command,
+                working_directory=self._working_directory,
+                test_path=project_path,
+                project_directory=self._project_directory,
+                memory_limit=self._memory,
+                cpus=self._cores,
+                instance_directory=INSTANCE_DIRECTORY,
+                additional_environment=additional_environment,
+            )
+            compose_path: str = f"{test_path}/docker-compose.yml"
+            with open(compose_path, "wt", encoding="UTF-8") as compose_file:
+                compose_file.write(compose_content)
 
         # nextflow config?
         if self._image_type == "nextflow":
@@ -233,27 +584,125 @@ class Compose:
 
         return project_path
 
-    def run(
-        self, timeout_minutes: int = DEFAULT_TEST_TIMEOUT_M
-    ) -> Tuple[int, str, str]:
-        """Runs the container for the test, expecting the docker-compose file
-        written by the 'create()'. The container exit code is returned to the
-        caller along with the stdout and stderr content.
-        A non-zero exit code does not necessarily mean the test has failed.
+    def _get_user(self) -> Tuple[int, int]:
+        """Returns the user and group IDs the test container is run as,
+        which are our own unless we've been given specific IDs.
         """
-        assert Compose.try_to_set_compose_command()
+        user_id = self._user_id if self._user_id is not None else os.getuid()
+        group_id = self._group_id if self._group_id is not None else os.getgid()
+        return user_id, group_id
 
-        execution_directory: str = self.get_test_path()
+    def _get_container_name(self) -> str:
+        """Returns the name of the test container. Grouped tests retain the
+        container name they've always had, other tests are named after
+        their (unique) project.
+        """
+        if self._project_name == GROUP_PROJECT_NAME:
+            return f"{self._job}-{self._test}-jote"
+        return f"{self._project_name}-jote"
+
+    def _get_run_command(self) -> List[str]:
+        """Returns the command used to run the test container.
+
+        Grouped tests are run using the docker-compose file written by
+        'create()' so that they share the test group's compose project
+        (and network).
+
+        The compose file is named explicitly (with '-f') so the command
+        does not depend on the current working directory, which is shared
+        by every thread in the process. By using '-p' ('--project-name')
+        we set the prefix for the network name and can use compose files
+        from different directories. Without this the network name
+        is prefixed by the directory the compose file is in.
+        We 'run' the job service (rather than bring the project 'up')
+        as it's a one-shot container. 'run' returns the container's
+        exit code and '--rm' removes the container when it's done.
+        '-T' is used as there's no terminal (we capture the output).
+
+        Other tests need nothing from compose so, to avoid its overhead
+        (and the creation and removal of a network for each test),
+        the container is run directly with 'docker run', using the same
+        settings a compose file would have. The container is not attached
+        to a 'jote' network, it's run on docker's default (bridge) network.
+        Variables in the values are substituted as compose would
+        (from the test environment and then our own), and a ValueError
+        is raised if a value cannot be interpolated.
+        """
+        if self._project_name == GROUP_PROJECT_NAME:
+            return Compose._COMPOSE_COMMAND.split() + [
+                "-f",
+                os.path.join(self.get_test_path(), "docker-compose.yml"),
+                "-p",
+                self._project_name,
+                "run",
+                "--rm",
+                "-T",
+                "job",
+            ]
 
-        print(f'# Compose: Executing the test ("{Compose._COMPOSE_COMMAND} up")...')
-        print(f'# Compose: Execution directory is "{execution_directory}"')
+        environment: Dict[str, str] = dict(os.environ)
+        environment.update(self._test_environment)
+        # The compose file 'entrypoint' is the whole command,
+        # but 'docker run' only accepts the executable as the entrypoint.
+        command: List[str] = shlex.split(_interpolate(self._command, environment))
+        user_id, group_id = self._get_user()
+        run_cmd: List[str] = [
+            "docker",
+            "run",
+            "--rm",
+            "--name",
+            self._get_container_name(),
+            "--user",
+            f"{user_id}:{group_id}",
+            "--entrypoint",
+            command[0],
+            "--workdir",
+            _interpolate(self._working_directory, environment),
+            "--volume",
+            "/var/run/docker.sock:/var/run/docker.sock",
+            "--volume",
+            f"{self.get_test_project_path()}:{self._project_directory}",
+            "--memory",
+            self._memory,
+            "--cpus",
+            f"{self._cores}.0",
+            "--env",
+            f"DM_INSTANCE_DIRECTORY={INSTANCE_DIRECTORY}",
+        ]
+        for e_name, e_value in self._test_environment.items():
+            run_cmd += ["--env", f"{e_name}={_interpolate(e_value, environment)}"]
+        return run_cmd + [_interpolate(self._image, environment)] + command[1:]
 
-        cwd = os.getcwd()
-        os.chdir(execution_directory)
+    def run(
+        self,
+        timeout_minutes: int = DEFAULT_TEST_TIMEOUT_M,
+        output_limit: Optional[int] = None,
+    ) -> Tuple[int, bytes, bytes]:
+        """Runs the container for the test, using the directory (and, for
+        grouped tests, the docker-compose file) written by 'create()'.
+        The container exit code is returned to the caller along with
+        the (undecoded) stdout and stderr content (just the last
+        'output_limit' bytes if a limit is set).
+        A non-zero exit code does not necessarily mean the test has failed.
+        """
+        assert Compose.try_to_set_compose_command()
 
+        try:
+            run_cmd: List[str] = self._get_run_command()
+        except ValueError as ex:
+            # As compose would, we fail without running the container.
+            print(f"# Compose: ERROR - {ex}")
+            return 1, b"", str(ex).encode("utf-8")
+
+        print(f'# Compose: Executing the test ("{" ".join(run_cmd[:2])}")...')
+        print(f'# Compose: Test directory is "{self.get_test_path()}"')
+
+        return_code: int = 0
+        test_stdout: bytes = b""
+        test_stderr: bytes = b""
         timeout: bool = False
         try:
-            # Run the container, and then cleanup.
+            # Run the container.
             # If a test environment is set then we pass in these values to the
             # process as we run it - but it also needs to have a copy of the
             # exiting environment.
@@ -262,71 +711,94 @@ class Compose:
                 env = os.environ.copy()
                 env.update(self._test_environment)
 
-            # By using '-p' ('--project-name')
-            # we set the prefix for the network name and can use compose files
-            # from different directories. Without this the network name
-            # is prefixed by the directory the compose file is in.
-            up_cmd: List[str] = Compose._COMPOSE_COMMAND.split() + [
-                "-p",
-                "data-manager",
-                "up",
-                "--exit-code-from",
-                "job",
-                "--abort-on-container-exit",
-            ]
-            test = subprocess.run(
-                up_cmd,
-                capture_output=True,
+            return_code, test_stdout, test_stderr = run_captured(
+                run_cmd,
                 timeout=timeout_minutes * 60,
-                check=False,
                 env=env,
-            )
-            down_cmd: List[str] = Compose._COMPOSE_COMMAND.split() + ["down"]
-            _ = subprocess.run(
-                down_cmd,
-                capture_output=True,
-                timeout=240,
-                check=False,
+                output_limit=output_limit,
             )
         except:  # pylint: disable=bare-except
             timeout = True
-        finally:
-            os.chdir(cwd)
 
         if timeout:
             print("# Compose: ERROR - Test timeout")
-            return_code: int = -911
-            test_stdout: str = ""
-            test_stderr: str = ""
+            # Stopping the docker client does not stop the container
+            if self._project_name != GROUP_PROJECT_NAME:
+                _ = subprocess.run(
+                    ["docker", "rm", "--force", self._get_container_name()],
+                    capture_output=True,
+                    timeout=240,
+                    check=False,
+                )
+            return_code = -911
+            test_stdout = b""
+            test_stderr = b""
         else:
-            print(f"# Compose: Executed (exit code {test.returncode})")
-            return_code = test.returncode
-            test_stdout = test.stdout.decode("utf-8")
-            test_stderr = test.stderr.decode("utf-8")
+            print(f"# Compose: Executed (exit code {return_code})")
 
         return return_code, test_stdout, test_stderr
 
-    def delete(self) -> None:
-        """Deletes a test directory created by 'create()'."""
-        print("# Compose: Deleting the test...")
-
+    def delete(self, background: bool = False) -> None:
+        """Deletes a test directory created by 'create()'.
+        If 'background' is True the directory is removed by a thread
+        and we return immediately. The caller must then use
+        'wait_for_deletions()' before it relies on the directory being gone.
+        """
         test_path: str = self.get_test_path()
-        if os.path.exists(test_path):
-            shutil.rmtree(test_path)
+        # There's only ever one deletion (of a directory) in progress.
+        _wait_for_deletion(test_path)
 
+        if background:
+            print("# Compose: Deleting the test (in the background)")
+            deletion: _Deletion = _Deletion(test_path)
+            with _PENDING_DELETIONS_LOCK:
+                _PENDING_DELETIONS[test_path] = deletion
+            deletion.start()
+            return
+
+        print("# Compose: Deleting the test...")
+        _remove_tree(test_path)
         print("# Compose: Deleted")
 
+    def stop_group_project(self) -> None:
+        """Takes down the compose project shared by grouped tests,
+        removing any of its containers that remain (i.e. after a test timeout)
+        and its 'data-manager_jote' network. This test's compose file is used
+        to do this, so it must be called before the test is deleted.
+        """
+        assert self._project_name == GROUP_PROJECT_NAME
+
+        print("# Compose: Stopping the test group project...")
+
+        down_cmd: List[str] = Compose._COMPOSE_COMMAND.split() + [
+            "-f",
+            f"{self.get_test_path()}/docker-compose.yml",
+            "-p",
+            GROUP_PROJECT_NAME,
+            "down",
+            "--remove-orphans",
+        ]
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            _ = subprocess.run(
+                down_cmd,
+                capture_output=True,
+                timeout=240,
+                check=False,
+            )
+
+        print("# Compose: Stopped the test group project")
+
     @staticmethod
     def try_to_set_compose_command() -> bool:
         """Tries to find the docker-compose command,
         setting Compose._COMPOSE_COMMAND when found"""
-        # Do we have the 'docker compose' command?
+        # Do we have the 'docker compose' (or 'docker-compose') command?
         if not Compose._COMPOSE_COMMAND:
-            Compose._COMPOSE_COMMAND = _get_docker_compose_command()
+            (
+                Compose._COMPOSE_COMMAND,
+                Compose._COMPOSE_VERSION,
+            ) = _get_docker_compose_command()
             print(f"# Compose command: {Compose._COMPOSE_COMMAND}")
-        # Do we have the 'docker-compose' command?
-        if not Compose._COMPOSE_VERSION:
-            Compose._COMPOSE_VERSION = _get_docker_compose_version()
             print(f"# Compose version: {Compose._COMPOSE_VERSION}")
 
         if Compose._COMPOSE_COMMAND and Compose._COMPOSE_VERSION:
@@ -369,7 +841,7 @@ class Compose:
                 "-f",
                 os.path.join("data-manager", compose_file),
                 "-p",
-                "data-manager",
+                GROUP_PROJECT_NAME,
                 "up",
                 "-d",
             ]
@@ -4,25 +4,49 @@
 
 Get help running this utility with 'jote --help'
 """
+from __future__ import annotations
+
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import contextlib
 from enum import Enum
+import io
 import os
+import re
 import shutil
 import stat
 from stat import S_IRGRP, S_IRUSR, S_IWGRP, S_IWUSR
-import subprocess
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, TextIO, Tuple
 
-from munch import DefaultMunch
 import yaml
-from yamllint import linter
-from yamllint.config import YamlLintConfig
 
-from decoder import decoder
+# The decoder, munch and yamllint are relatively expensive to import
+# (the decoder loads its schemas when it's imported) so they're imported
+# by the functions that use them, and not at all for things like
+# '--version' or '--wipe'.
+if TYPE_CHECKING:
+    from munch import DefaultMunch
+    from yamllint.config import YamlLintConfig
 
 from .compose import get_test_root, INSTANCE_DIRECTORY, DEFAULT_TEST_TIMEOUT_M
-from .compose import Compose
+from .compose import (
+    GROUP_PROJECT_NAME,
+    Compose,
+    interrupt_running_commands,
+    pull_images,
+    run_captured,
+    wait_for_deletions,
+)
+
+# Our YAML loader.
+# Job definitions and manifests are plain YAML so we use the 'safe' loader,
+# preferring the (much faster) libyaml-based loader if PyYAML has it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 # Where can we expect to find Job definitions?
 _DEFINITION_DIRECTORY: str = "data-manager"
@@ -35,6 +59,10 @@ _DATA_DIRECTORY_PATH: str = f"{_DATA_DIRECTORY}/"
 # Our yamllint configuration file
 # from the same directory as us.
 _YAMLLINT_FILE: str = os.path.join(os.path.dirname(__file__), "jote.yamllint")
+# The (parsed) yamllint configuration,
+# built by the first call to '_get_lint_config()' and then re-used.
+_YAMLLINT_CONFIG: Optional[YamlLintConfig] = None
+_YAMLLINT_CONFIG_LOCK: threading.Lock = threading.Lock()
 
 # Read the version file
 _VERSION_FILE: str = os.path.join(os.path.dirname(__file__), "VERSION")
@@ -56,6 +84,52 @@ _USR_HOME: str = os.environ.get("HOME", "")
 # has such a prefix.
 _TEST_INPUT_URL_MARKER: str = "://"
 
+# A definition's top-level 'collection' line (and its value),
+# and whether the value continues on the (indented) line that follows.
+# Used to find a definition's collection without parsing all of it.
+_COLLECTION_LINE_RE: re.Pattern[bytes] = re.compile(
+    rb"^collection:(?P<value>.*)$(?P<continued>\r?\n[ \t]+[^\s#])?", re.MULTILINE
+)
+
+# The size of the blocks of a file used when counting its lines.
+_LINE_COUNT_BLOCK_SIZE: int = 1 << 20
+
+# The maximum number of job definition files that are loaded concurrently.
+_MAX_LOAD_WORKERS: int = 8
+
+# The default number of (ungrouped) tests that can be run concurrently
+# (see '--jobs'). We leave a couple of cores for docker and the rest
+# of the system.
+_DEFAULT_TEST_WORKERS: int = max(1, (os.cpu_count() or 1) - 2)
+
+# The start of Jinja2 expressions, statements and comments.
+# A command without any of these does not need to be rendered.
+_JINJA2_MARKERS: Tuple[str, ...] = ("{{", "{%", "{#")
+
+# A translation table that removes line boundaries from a string
+# (the characters 'str.splitlines()' splits on).
+_LINE_BOUNDARY_TABLE: Dict[int, Optional[int]] = str.maketrans(
+    "", "", "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+)
+
+# Unless '--verbose' is used a test's output is only displayed if the test
+# fails, and then only the last part of it (bytes). This limits the output
+# that's read (back) into memory for each test.
+_TEST_OUTPUT_LIMIT: int = 1 << 16
+
+# Test input files that we've found.
+# Tests often share inputs, and the repository's files are not expected
+# to disappear during a run, so each is only checked once.
+_FOUND_INPUT_FILES: Set[str] = set()
+
+# Test images that could not be pulled (and are not local images).
+# Tests that use one of these fail (without being run).
+_UNAVAILABLE_IMAGES: Set[str] = set()
+
+# An ungrouped test, i.e. the definition filename, collection,
+# job name, test name and the job definition.
+_UngroupedTest = Tuple[str, str, str, str, "DefaultMunch"]
+
 
 class TestResult(Enum):
     """Return value from '_run_a_test()'"""
@@ -66,20 +140,70 @@ class TestResult(Enum):
     IGNORED = 3
 
 
+class _ThreadOutput(io.TextIOBase):
+    """A replacement for stdout that, for threads that have started collecting,
+    collects what's written into a per-thread buffer. Tests (and definition
+    files) are processed concurrently so this allows the output of each
+    to be printed as a single block when it's done.
+    Output from threads that are not collecting is passed through.
+    """
+
+    def __init__(self, stdout: TextIO):
+        super().__init__()
+        self._stdout: TextIO = stdout
+        self._local: threading.local = threading.local()
+
+    def start(self) -> None:
+        """Starts collecting the calling thread's output."""
+        self._local.buffer = io.StringIO()
+
+    def stop(self) -> str:
+        """Stops collecting the calling thread's output, returning it."""
+        buffer: io.StringIO = self._local.buffer
+        self._local.buffer = None
+        return buffer.getvalue()
+
+    def write(self, text: str) -> int:
+        buffer: Optional[io.StringIO] = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._stdout.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        self._stdout.flush()
+
+
 def _print_test_banner(collection: str, job_name: str, job_test_name: str) -> None:
     print("  ---")
     print(f"+ collection={collection} job={job_name} test={job_test_name}")
 
 
-def _lint(definition_filename: str) -> bool:
-    """Lints the provided job definition file."""
+def _get_lint_config() -> Optional[YamlLintConfig]:
+    """Returns our yamllint configuration, or None if the file is missing.
+    The file is only read (and parsed) once, by the first caller.
+    """
+    global _YAMLLINT_CONFIG  # pylint: disable=global-statement
+    from yamllint.config import (  # pylint: disable=import-outside-toplevel
+        YamlLintConfig,
+    )
+
+    with _YAMLLINT_CONFIG_LOCK:
+        if _YAMLLINT_CONFIG is None and os.path.isfile(_YAMLLINT_FILE):
+            _YAMLLINT_CONFIG = YamlLintConfig(file=_YAMLLINT_FILE)
+        return _YAMLLINT_CONFIG
+
+
+def _lint(definition_filename: str, definition: str) -> bool:
+    """Lints the provided job definition file (using its content)."""
 
-    if not os.path.isfile(_YAMLLINT_FILE):
+    lint_config: Optional[YamlLintConfig] = _get_lint_config()
+    if lint_config is None:
         print(f"! The yamllint file ({_YAMLLINT_FILE}) is missing")
         return False
 
-    with open(definition_filename, "rt", encoding="UTF-8") as definition_file:
-        errors = linter.run(definition_file, YamlLintConfig(file=_YAMLLINT_FILE))
+    from yamllint import linter  # pylint: disable=import-outside-toplevel
+
+    errors = linter.run(definition, lint_config)
 
     if errors:
         # We're given a 'generator' and we don't know if there are errors
@@ -88,7 +212,7 @@ def _lint(definition_filename: str) -> bool:
         found_errors: bool = False
         for error in errors:
             if not found_errors:
-                print(f'! Job definition "{definition_file}" fails yamllint:')
+                print(f'! Job definition "{definition_filename}" fails yamllint:')
                 found_errors = True
             print(error)
         if found_errors:
@@ -108,16 +232,15 @@ def _get_test_input_url_prefix(test_input_string: str) -> Optional[str]:
     return None
 
 
-def _validate_schema(definition_filename: str) -> bool:
-    """Checks the Job Definition against the decoder's schema."""
-
-    with open(definition_filename, "rt", encoding="UTF-8") as definition_file:
-        job_def: Optional[Dict[str, Any]] = yaml.load(
-            definition_file, Loader=yaml.FullLoader
-        )
+def _validate_schema(
+    job_def: Optional[Dict[str, Any]], definition_filename: str
+) -> bool:
+    """Checks the (loaded) Job Definition against the decoder's schema."""
     assert job_def
 
     # If the decoder returns something there's been an error.
+    from decoder import decoder  # pylint: disable=import-outside-toplevel
+
     error: Optional[str] = decoder.validate_job_schema(job_def)
     if error:
         print(
@@ -130,17 +253,16 @@ def _validate_schema(definition_filename: str) -> bool:
     return True
 
 
-def _validate_manifest_schema(manifest_filename: str) -> bool:
-    """Checks the Manifest against the decoder's schema."""
-
-    with open(manifest_filename, "rt", encoding="UTF-8") as definition_file:
-        job_def: Optional[Dict[str, Any]] = yaml.load(
-            definition_file, Loader=yaml.FullLoader
-        )
-    assert job_def
+def _validate_manifest_schema(
+    manifest: Optional[Dict[str, Any]], manifest_filename: str
+) -> bool:
+    """Checks the (loaded) Manifest against the decoder's schema."""
+    assert manifest
 
     # If the decoder returns something there's been an error.
-    error: Optional[str] = decoder.validate_manifest_schema(job_def)
+    from decoder import decoder  # pylint: disable=import-outside-toplevel
+
+    error: Optional[str] = decoder.validate_manifest_schema(manifest)
     if error:
         print(f'! Manifest "{manifest_filename}"' " does not comply with schema")
         print("! Full response follows:")
@@ -222,11 +344,93 @@ def _add_grouped_test(
                 )
 
 
+def _get_definition_collection(jd_content: bytes) -> Optional[str]:
+    """Returns the collection of a (raw) job definition by parsing
+    just its top-level 'collection' line. None is returned
+    if there isn't exactly one such line, if its value may be spread
+    over more than one line (it's empty, a block or folded scalar,
+    or continues on the next line) or if it can't be parsed
+    (an unclosed quote for example). The whole definition
+    will then need to be parsed.
+    """
+    collection_lines: List[re.Match[bytes]] = list(
+        _COLLECTION_LINE_RE.finditer(jd_content)
+    )
+    if len(collection_lines) != 1:
+        return None
+    value: bytes = collection_lines[0].group("value").strip()
+    if not value or value[:1] in (b"|", b">") or collection_lines[0].group("continued"):
+        return None
+    try:
+        collection_line: Any = yaml.load(b"collection: " + value, Loader=_YamlLoader)
+    except yaml.YAMLError:
+        return None
+    if isinstance(collection_line, dict) and isinstance(
+        collection_line.get("collection"), str
+    ):
+        return str(collection_line["collection"]) or None
+    return None
+
+
+def _parse_definition(
+    thread_output: _ThreadOutput,
+    jd_path: str,
+    skip_lint: bool,
+    collection: Optional[str],
+) -> Tuple[int, Optional[Dict[str, Any]], str]:
+    """Checks and loads a job definition file, returning a status
+    (0 if successful, -1 if the definition does not comply with the schema
+    and -2 if it fails yamllint), the definition, and any output.
+    If a collection is named, definitions for any other collection
+    are not checked and no definition is returned.
+    This is run from a worker thread so output is collected
+    rather than printed.
+    """
+    status: int = 0
+    job_def: Optional[Dict[str, Any]] = None
+
+    thread_output.start()
+    try:
+        # The file is only read (and parsed) once,
+        # the parsed definition is validated and its content is linted.
+        # It's read as bytes (PyYAML decodes UTF-8 itself),
+        # we only need to decode it if it's going to be linted.
+        with open(jd_path, "rb") as jd_file:
+            jd_content: bytes = jd_file.read()
+        # Skip the (relatively expensive) parse and checks
+        # if the definition's not for the collection we're testing.
+        # We can usually tell from its 'collection' line.
+        if collection:
+            jd_collection: Optional[str] = _get_definition_collection(jd_content)
+            if jd_collection is not None and jd_collection != collection:
+                return status, None, ""
+        job_def = yaml.load(jd_content, Loader=_YamlLoader)
+        if (
+            collection
+            and isinstance(job_def, dict)
+            and job_def.get("collection") != collection
+        ):
+            return status, None, ""
+        # Does the definition comply with the schema?
+        # No options here - it must.
+        # And then YAML-lint the definition (unless told not to).
+        if not _validate_schema(job_def, jd_path):
+            status = -1
+        elif not skip_lint and not _lint(jd_path, jd_content.decode("UTF-8")):
+            status = -2
+    finally:
+        output: str = thread_output.stop()
+
+    return status, job_def, output
+
+
 def _load(
-    manifest_filename: str, skip_lint: bool
+    manifest_filename: str, skip_lint: bool, collection: Optional[str] = None
 ) -> Tuple[List[DefaultMunch], Dict[str, Any], int]:
     """Loads definition files listed in the manifest
-    and extracts the definitions that contain at least one test. The
+    and extracts the definitions that contain at least one test.
+    If a collection is named only the definitions for that collection
+    are checked and loaded. The
     definition blocks for those that have tests (ignored or otherwise)
     are returned along with a count of the number of tests found
     (ignored or otherwise).
@@ -234,6 +438,8 @@ def _load(
     If there was a problem loading the files an empty list and
     -ve count is returned.
     """
+    from munch import DefaultMunch  # pylint: disable=import-outside-toplevel
+
     # Prefix manifest filename with definition directory if required...
     manifest_path: str = (
         manifest_filename
@@ -244,16 +450,11 @@ def _load(
         print(f'! The manifest file is missing ("{manifest_path}")')
         return [], {}, -1
 
-    if not _validate_manifest_schema(manifest_path):
+    with open(manifest_path, "rb") as manifest_file:
+        manifest: Dict[str, Any] = yaml.load(manifest_file, Loader=_YamlLoader)
+    if not _validate_manifest_schema(manifest, manifest_path):
         return [], {}, -1
 
-    with open(manifest_path, "r", encoding="UTF-8") as manifest_file:
-        manifest: Dict[str, Any] = yaml.load(manifest_file, Loader=yaml.FullLoader)
-    manifest_munch: Optional[DefaultMunch] = None
-    if manifest:
-        manifest_munch = DefaultMunch.fromDict(manifest)
-    assert manifest_munch
-
     # Iterate through the named files.
     # 'job_definitions' are all those jobs that have at least one test that is not
     # part of a 'run-group'. 'grouped_job_definitions' are all the definitions that
@@ -269,22 +470,35 @@ def _load(
     grouped_job_definitions: Dict[str, Any] = {}
     num_tests: int = 0
 
-    for jd_filename in manifest_munch["job-definition-files"]:
-        # Does the definition comply with the schema?
-        # No options here - it must.
-        jd_path: str = os.path.join(_DEFINITION_DIRECTORY, jd_filename)
-        if not _validate_schema(jd_path):
-            return [], {}, -1
-
-        # YAML-lint the definition?
-        if not skip_lint:
-            if not _lint(jd_path):
-                return [], {}, -2
+    # The files are independent so they're checked and parsed concurrently.
+    # Results (and output) are handled in manifest order.
+    jd_paths: List[str] = [
+        f"{_DEFINITION_DIRECTORY}/{jd_filename}"
+        for jd_filename in manifest["job-definition-files"]
+    ]
+    if not jd_paths:
+        return job_definitions, grouped_job_definitions, num_tests
+
+    thread_output: _ThreadOutput = _ThreadOutput(sys.stdout)
+    with contextlib.redirect_stdout(thread_output):
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_MAX_LOAD_WORKERS, len(jd_paths)))
+        ) as executor:
+            parsed_definitions: List[Tuple[int, Optional[Dict[str, Any]], str]] = list(
+                executor.map(
+                    lambda jd_path: _parse_definition(
+                        thread_output, jd_path, skip_lint, collection
+                    ),
+                    jd_paths,
+                )
+            )
 
-        # Load the Job definitions optionally compiling a set of 'run-groups'
-        with open(jd_path, "r", encoding="UTF-8") as jd_file:
-            job_def: Dict[str, Any] = yaml.load(jd_file, Loader=yaml.FullLoader)
+    for jd_path, (status, job_def, output) in zip(jd_paths, parsed_definitions):
+        print(output, end="")
+        if status < 0:
+            return [], {}, status
 
+        # Compile the Job definitions, and the set of 'run-groups'
         if job_def:
             jd_munch: DefaultMunch = DefaultMunch.fromDict(job_def)
 
@@ -299,11 +513,12 @@ def _load(
             # Process each job.
             # It goes into 'job_definitions' if it has at least one non-grouped test,
             # and into 'grouped_job_definitions' if it has at least one grouped test.
+            file_tests: int = 0
             for jd_name in jd_munch.jobs:
                 test_run_group_names: List[str] = []
                 if jd_munch.jobs[jd_name].tests:
                     # Job has some tests
-                    num_tests += len(jd_munch.jobs[jd_name].tests)
+                    file_tests += len(jd_munch.jobs[jd_name].tests)
                     for job_test in jd_munch.jobs[jd_name].tests:
                         # Is there a run-group defined for this test?
                         if "run-groups" in jd_munch.jobs[jd_name].tests[job_test]:
@@ -334,39 +549,99 @@ def _load(
                             grouped_job_definitions,
                         )
 
-            # Job definitions is simply a copy of the whole decoded file.
-            job_definitions.append(jd_munch)
+            # Job definitions is simply a copy of the whole decoded file,
+            # but there's no need to keep a file that has no tests.
+            if file_tests:
+                job_definitions.append(jd_munch)
+                num_tests += file_tests
 
     return job_definitions, grouped_job_definitions, num_tests
 
 
-def _copy_inputs(test_inputs: List[str], project_path: str) -> bool:
-    """Copies all the test files into the test project directory."""
+def _stage_input(test_input: str, project_path: str, link: bool) -> None:
+    """Puts a test input file into the test project directory.
+    The file's content (and its permission bits, inputs may be executable
+    scripts) is copied (by the kernel where possible) unless we've
+    been asked to link inputs. Then, where we can (i.e. the repository
+    and project are on the same file-system), the file is hard-linked,
+    which avoids copying the file's content.
+    """
+    destination: str = f"{project_path}/{os.path.basename(test_input)}"
+    if link:
+        try:
+            os.link(test_input, destination)
+            return
+        except OSError:
+            pass
+    shutil.copy(test_input, destination)
+
+
+def _is_input_file(test_input: str) -> bool:
+    """Returns True if a test input is a file, only checking the file-system
+    for inputs we haven't already found.
+    """
+    if test_input in _FOUND_INPUT_FILES:
+        return True
+    if os.path.isfile(test_input):
+        _FOUND_INPUT_FILES.add(test_input)
+        return True
+    return False
+
+
+def _copy_inputs(test_inputs: List[str], project_path: str, link: bool) -> bool:
+    """Copies (or links) all the test files into the test project directory."""
 
     # The files are assumed to reside in the repo's 'data' directory.
     print(f'# Copying inputs (from "${{PWD}}/{_DATA_DIRECTORY_PATH}")...')
-    for test_input in test_inputs:
-        print(f"# + {test_input}")
 
+    # Check all the inputs before we copy any of them
+    for test_input in test_inputs:
         if not test_input.startswith(_DATA_DIRECTORY_PATH):
             print("! FAILURE")
             print(f'! Input file {test_input} must start with "{_DATA_DIRECTORY_PATH}"')
             return False
-        if not os.path.isfile(test_input):
+        if not _is_input_file(test_input):
             print("! FAILURE")
             print(f"! Missing input file {test_input} ({test_input})")
             return False
 
-        # Looks OK, copy it
-        shutil.copy(test_input, project_path)
+    # Looks OK, copy (or link) them
+    for test_input in test_inputs:
+        print(f"# + {test_input}")
+        _stage_input(test_input, project_path, link)
 
     print("# Copied")
 
     return True
 
 
-def _check_exists(name: str, path: str, expected: bool, fix_permissions: bool) -> bool:
-    exists: bool = os.path.exists(path)
+def _stat_output(
+    entries: Dict[str, os.DirEntry[str]], name: str, path: str
+) -> Optional[os.stat_result]:
+    """Returns the stat result for a test output, or None if it does not exist
+    (or cannot be stat'd). Outputs in the project directory are found in its (scanned) 'entries',
+    which saves a system call for outputs that do not exist.
+    Anything else (an output in a sub-directory) is stat'd.
+    """
+    try:
+        if name in entries:
+            return entries[name].stat()
+        if os.path.dirname(name):
+            return os.stat(path)
+    except OSError:
+        # e.g. a broken symbolic link, or a path we cannot access,
+        # which (as with 'os.path.exists()') does not exist.
+        pass
+    return None
+
+
+def _check_exists(
+    name: str,
+    stat_info: Optional[os.stat_result],
+    expected: bool,
+    fix_permissions: bool,
+) -> bool:
+    exists: bool = stat_info is not None
     if expected and not exists:
         print(f"#   exists ({expected}) [FAILED]")
         print("! FAILURE")
@@ -384,8 +659,7 @@ def _check_exists(name: str, path: str, expected: bool, fix_permissions: bool) -
     # If 'fix_permissions' is True (i.e. the DM is expected to fix (group) permissions)
     # the group permissions are expected to be incorrect. If False
     # then the group permissions are expected to be correct/
-    if exists:
-        stat_info: os.stat_result = os.stat(path)
+    if stat_info:
         # Check user permissions
         file_mode: int = stat_info.st_mode
         if file_mode & S_IRUSR == 0 or file_mode & S_IWUSR == 0:
@@ -421,11 +695,39 @@ def _check_exists(name: str, path: str, expected: bool, fix_permissions: bool) -
     return True
 
 
-def _check_line_count(name: str, path: str, expected: int) -> bool:
+def _count_line_breaks(block: bytes, previous_byte: bytes) -> int:
+    """Counts the line breaks in a block of a file. As with universal newlines
+    (how a file opened in text mode is read) '\\n', '\\r' and '\\r\\n'
+    are each a line break. 'previous_byte' is the last byte of the previous block
+    (a '\\r\\n' may be split between blocks).
+    """
+    line_breaks: int = block.count(b"\n")
+    carriage_returns: int = block.count(b"\r")
+    if carriage_returns:
+        line_breaks += carriage_returns - block.count(b"\r\n")
+    if previous_byte == b"\r" and block[:1] == b"\n":
+        line_breaks -= 1
+    return line_breaks
+
+
+def _count_lines(path: str) -> int:
+    """Counts the lines in a file. Rather than iterate over the lines
+    (decoding the file) we count its line breaks in blocks read from the file.
+    A final line without a line break is still a line.
+    """
     line_count: int = 0
-    with open(path, "rt", encoding="UTF-8") as check_file:
-        for _ in check_file:
-            line_count += 1
+    last_byte: bytes = b""
+    with open(path, "rb", buffering=0) as check_file:
+        for block in iter(lambda: check_file.read(_LINE_COUNT_BLOCK_SIZE), b""):
+            line_count += _count_line_breaks(block, last_byte)
+            last_byte = block[-1:]
+    if last_byte not in (b"", b"\n", b"\r"):
+        line_count += 1
+    return line_count
+
+
+def _check_line_count(name: str, path: str, expected: int) -> bool:
+    line_count: int = _count_lines(path)
 
     if line_count != expected:
         print(f"#   lineCount ({line_count}) [FAILED]")
@@ -445,40 +747,52 @@ def _check(
     If 'fix_permissions' is True we error if the permissions are correct,
     if False we error if the permissions are not correct.
     """
-    assert t_compose
-    assert isinstance(t_compose, Compose)
     assert output_checks
-    assert isinstance(output_checks, List)
 
     print("# Checking...")
 
+    # Scan the project directory once rather than stat each output
+    project_path: str = t_compose.get_test_project_path()
+    with os.scandir(project_path) as it:
+        entries: Dict[str, os.DirEntry[str]] = {entry.name: entry for entry in it}
+
     for output_check in output_checks:
         output_name: str = output_check.name
         print(f"# - {output_name}")
-        expected_file: str = os.path.join(
-            t_compose.get_test_project_path(), output_name
-        )
+        expected_file: str = f"{project_path}/{output_name}"
 
         for check in output_check.checks:
-            check_type: str = list(check.keys())[0]
-            if check_type == "exists":
-                if not _check_exists(
-                    output_name, expected_file, check.exists, fix_permissions
-                ):
-                    return False
-            elif check_type == "lineCount":
-                if not _check_line_count(output_name, expected_file, check.lineCount):
+            # Each check is a single-entry map of the check type and its value
+            for check_type, check_value in check.items():
+                if check_type == "exists":
+                    if not _check_exists(
+                        output_name,
+                        _stat_output(entries, output_name, expected_file),
+                        check_value,
+                        fix_permissions,
+                    ):
+                        return False
+                elif check_type == "lineCount":
+                    if not _check_line_count(output_name, expected_file, check_value):
+                        return False
+                else:
+                    print("! FAILURE")
+                    print(f"! Unknown output check type ({check_type})")
                     return False
-            else:
-                print("! FAILURE")
-                print(f"! Unknown output check type ({check_type})")
-                return False
 
     print("# Checked")
 
     return True
 
 
+def _decode_output(output: bytes) -> str:
+    """Decodes test output for display. The output's only decoded
+    when it's going to be printed, and a test that writes something
+    that isn't UTF-8 shouldn't upset us.
+    """
+    return output.decode("utf-8", errors="replace")
+
+
 def _run_nextflow(
     *,
     command: str,
@@ -486,9 +800,11 @@ def _run_nextflow(
     nextflow_config_file: str,
     test_environment: Optional[Dict[str, str]] = None,
     timeout_minutes: int = DEFAULT_TEST_TIMEOUT_M,
-) -> Tuple[int, str, str]:
+    output_limit: Optional[int] = None,
+) -> Tuple[int, bytes, bytes]:
     """Runs nextflow in the project directory returning the exit code,
-    stdout and stderr.
+    stdout and stderr (undecoded, and just the last 'output_limit' bytes
+    if a limit is set).
     """
     assert command
     assert project_path
@@ -499,14 +815,14 @@ def _run_nextflow(
     # Nextflow looks here and any config will be merged with the test config.
     if _USR_HOME:
         home_config: str = os.path.join(_USR_HOME, ".nextflow", "config")
-        if os.path.exists(home_config) and os.path.isfile(home_config):
+        if os.path.isfile(home_config):
             print("! FAILURE")
             print(
                 "! A nextflow test but"
                 f" you have your own config file ({home_config})"
             )
             print("! You cannot test Jobs and have your own config file")
-            return 1, "", ""
+            return 1, b"", b""
 
     # Is there a Nextflow config file defined for this test?
     # It's a file in the 'data-manager' directory.
@@ -521,9 +837,6 @@ def _run_nextflow(
 
     print(f'# Execution directory is "{project_path}"')
 
-    cwd = os.getcwd()
-    os.chdir(project_path)
-
     # Inject an environment?
     # Yes if some variables are provided.
     # We copy the exiting env and add those provided.
@@ -532,19 +845,16 @@ def _run_nextflow(
         env = os.environ.copy()
         env.update(test_environment)
 
-    try:
-        test = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            capture_output=True,
-            timeout=timeout_minutes * 60,
-            env=env,
-        )
-    finally:
-        os.chdir(cwd)
-
-    return test.returncode, test.stdout.decode("utf-8"), test.stderr.decode("utf-8")
+    # Nextflow is run from the project directory.
+    # We do not change directory, which would affect every test thread.
+    return run_captured(
+        command,
+        timeout=timeout_minutes * 60,
+        cwd=project_path,
+        env=env,
+        shell=True,
+        output_limit=output_limit,
+    )
 
 
 def _run_a_test(
@@ -564,6 +874,9 @@ def _run_a_test(
 
     _print_test_banner(collection, job, job_test_name)
 
+    # The test's definition (used throughout)
+    job_test: DefaultMunch = job_definition.tests[job_test_name]
+
     # The status changes to False if any
     # part of this block fails.
     print(f"> definition filename={filename}")
@@ -571,7 +884,7 @@ def _run_a_test(
     # Does the test have an 'ignore' declaration?
     # Obey it unless the test is named explicitly -
     # i.e. if th user has named a specific test, run it.
-    if "ignore" in job_definition.tests[job_test_name]:
+    if "ignore" in job_test:
         if args.test:
             print("W Ignoring the ignore: property (told to run this test)")
         else:
@@ -583,8 +896,8 @@ def _run_a_test(
     if args.test:
         print("W Ignoring any run-level check (told to run this test)")
     else:
-        if "run-level" in job_definition.tests[job_test_name]:
-            run_level = job_definition.tests[job_test_name]["run-level"]
+        if "run-level" in job_test:
+            run_level = job_test["run-level"]
             print(f"> run-level={run_level}")
             if run_level > args.run_level:
                 print(f'W Skipping test (test is "run-level: {run_level}")')
@@ -600,12 +913,7 @@ def _run_a_test(
     # Render the command for this test.
 
     # First extract any variables and values from 'options' (if there are any).
-    job_variables: Dict[str, Any] = {}
-    if job_definition.tests[job_test_name].options:
-        for variable in job_definition.tests[job_test_name].options:
-            job_variables[variable] = job_definition.tests[job_test_name].options[
-                variable
-            ]
+    job_variables: Dict[str, Any] = dict(job_test.options or {})
 
     # If the option variable's declaration is 'multiple'
     # it must be handled as a list, e.g. it might be declared like this: -
@@ -630,15 +938,25 @@ def _run_a_test(
     input_files: List[str] = []
 
     # Process every 'input'
-    if job_definition.tests[job_test_name].inputs:
-        for variable in job_definition.tests[job_test_name].inputs:
+    if job_test.inputs:
+        # A job need not declare any options (it may only have inputs)
+        job_options: Optional[DefaultMunch] = job_definition.variables.options
+        option_properties: DefaultMunch = (
+            job_options.properties if job_options and job_options.properties else {}
+        )
+        # A job need not declare any inputs (it may only have options)
+        job_inputs: Optional[DefaultMunch] = job_definition.variables.inputs
+        input_properties: DefaultMunch = (
+            job_inputs.properties if job_inputs and job_inputs.properties else {}
+        )
+        for variable, test_value in job_test.inputs.items():
             # Test variable must be known as an input or option.
             # Is the variable an option (otherwise it's an input)
             variable_is_option: bool = False
             variable_is_input: bool = False
-            if variable in job_definition.variables.options.properties:
+            if variable in option_properties:
                 variable_is_option = True
-            elif variable in job_definition.variables.inputs.properties:
+            elif variable in input_properties:
                 variable_is_input = True
             if not variable_is_option and not variable_is_input:
                 print("! FAILURE")
@@ -649,13 +967,11 @@ def _run_a_test(
                 return None, TestResult.FAILED
 
             if variable_is_input:
+                input_property: DefaultMunch = input_properties[variable]
                 # Variable has no corresponding input file if it's type is'molecules'
                 # and the value looks like a molecule.
-                if (
-                    job_definition.variables.inputs.properties[variable].type
-                    == "molecules"
-                ):
-                    value = job_definition.tests[job_test_name].inputs[variable]
+                if input_property.type == "molecules":
+                    value = test_value
                     prefix = _get_test_input_url_prefix(value)
                     if prefix:
                         # There's a prefix so it's a file (not a molecule string).
@@ -683,11 +999,9 @@ def _run_a_test(
                     #   "nsp13-x0176_0B.mol,nsp13-x0176_0B_apo-desolv.pdb"
                     # and in the input files as two files: -
                     #   "data/nsp13-x0176_0B.mol" and "data/nsp13-x0176_0B_apo-desolv.pdb"
-                    if job_definition.variables.inputs.properties[variable].multiple:
+                    if input_property.multiple:
                         job_variables[variable] = []
-                        for value in job_definition.tests[job_test_name].inputs[
-                            variable
-                        ]:
+                        for value in test_value:
                             basename_values = []
                             for value_item in value.split(","):
                                 value_basename = os.path.basename(value_item)
@@ -695,7 +1009,7 @@ def _run_a_test(
                                 input_files.append(value_item)
                             job_variables[variable].append(",".join(basename_values))
                     else:
-                        value = job_definition.tests[job_test_name].inputs[variable]
+                        value = test_value
                         # Accommodate multiple files in a single input (comma-separated).
                         # We need ech to be put into 'input files' and the
                         # basename-normalised pair put into job variables
@@ -720,8 +1034,8 @@ def _run_a_test(
     # Has the user defined any environment variables in the test?
     # If so they must exist, although we don't care about their value.
     # Extract them here to pass to the test.
-    if "environment" in job_definition.tests[job_test_name]:
-        for env_name in job_definition.tests[job_test_name].environment:
+    if "environment" in job_test:
+        for env_name in job_test.environment:
             if test_group_environment and env_name in test_group_environment:
                 # The environment variable is provided by the test group,
                 # we don't need to go to the OS, we'll use what's provided.
@@ -734,7 +1048,8 @@ def _run_a_test(
                     print(f"! variable={env_name}")
                     # Record but do no further processing
                     return None, TestResult.FAILED
-            assert env_value
+            # (an empty value is still a defined value)
+            assert env_value is not None
             test_environment[env_name] = env_value
 
     # Get the raw (encoded) command from the job definition...
@@ -743,12 +1058,22 @@ def _run_a_test(
     if args.verbose:
         print(f"> raw_command={raw_command}")
         print(f"> job_variables={job_variables}")
-    decoded_command, test_status = decoder.decode(
-        raw_command,
-        job_variables,
-        "command",
-        decoder.TextEncoding.JINJA2_3_0,
-    )
+    test_status: bool = True
+    if raw_command.strip() and not any(
+        marker in raw_command for marker in _JINJA2_MARKERS
+    ):
+        # A command without any Jinja2 syntax renders as itself (stripped),
+        # so we can avoid the cost of rendering it.
+        decoded_command = raw_command.strip()
+    else:
+        from decoder import decoder  # pylint: disable=import-outside-toplevel
+
+        decoded_command, test_status = decoder.decode(
+            raw_command,
+            job_variables,
+            "command",
+            decoder.TextEncoding.JINJA2_3_0,
+        )
     if not test_status:
         print("! FAILURE")
         print("! Failed to render command")
@@ -757,9 +1082,9 @@ def _run_a_test(
         return None, TestResult.FAILED
 
     # The command must not contain new-lines.
-    # So split then join the command.
+    # So remove them (in one pass over the command).
     assert decoded_command
-    job_command: str = "".join(decoded_command.splitlines())
+    job_command: str = decoded_command.translate(_LINE_BOUNDARY_TABLE)
 
     if args.image_tag:
         print(f"W Replacing image tag. Using '{args.image_tag}'")
@@ -790,6 +1115,13 @@ def _run_a_test(
     print(f"> image-type={job_image_type}")
     print(f"> command={job_command}")
 
+    # Is the test's image available?
+    # (we'll have found out when the test images were pulled)
+    if job_image_type == _IMAGE_TYPE_SIMPLE and job_image in _UNAVAILABLE_IMAGES:
+        print("! FAILURE")
+        print(f"! Test image is not available ({job_image})")
+        return None, TestResult.FAILED
+
     # Create the project
     t_compose: Compose = Compose(
         collection,
@@ -804,28 +1136,31 @@ def _run_a_test(
         job_command,
         test_environment,
         args.run_as_user,
+        project_name=GROUP_PROJECT_NAME if test_group else None,
     )
     project_path: str = t_compose.create()
 
     if input_files:
         # Copy the data into the test's project directory.
         # Data's expected to be found in the Job's 'inputs'.
-        if not _copy_inputs(input_files, project_path):
+        if not _copy_inputs(input_files, project_path, args.link_inputs):
             return t_compose, TestResult.FAILED
 
     # Run the container
     if not args.dry_run:
         timeout_minutes: int = DEFAULT_TEST_TIMEOUT_M
-        if "timeout-minutes" in job_definition.tests[job_test_name]:
-            timeout_minutes = job_definition.tests[job_test_name]["timeout-minutes"]
+        if "timeout-minutes" in job_test:
+            timeout_minutes = job_test["timeout-minutes"]
+
+        # We only need all the output if we're going to display it
+        output_limit: Optional[int] = None if args.verbose else _TEST_OUTPUT_LIMIT
 
         exit_code: int = 0
-        out: str = ""
-        err: str = ""
+        out: bytes = b""
+        err: bytes = b""
         if job_image_type in [_IMAGE_TYPE_SIMPLE]:
             # Run the image container
-            assert t_compose
-            exit_code, out, err = t_compose.run(timeout_minutes)
+            exit_code, out, err = t_compose.run(timeout_minutes, output_limit)
         elif job_image_type in [_IMAGE_TYPE_NEXTFLOW]:
             # Run nextflow directly
             assert job_command
@@ -833,10 +1168,8 @@ def _run_a_test(
 
             # Is there a nextflow config file for this test?
             nextflow_config_file: str = ""
-            if "nextflow-config-file" in job_definition.tests[job_test_name]:
-                nextflow_config_file = job_definition.tests[job_test_name][
-                    "nextflow-config-file"
-                ]
+            if "nextflow-config-file" in job_test:
+                nextflow_config_file = job_test["nextflow-config-file"]
 
             exit_code, out, err = _run_nextflow(
                 command=job_command,
@@ -844,35 +1177,37 @@ def _run_a_test(
                 nextflow_config_file=nextflow_config_file,
                 test_environment=test_environment,
                 timeout_minutes=timeout_minutes,
+                output_limit=output_limit,
             )
         else:
             print("! FAILURE")
             print(f"! unsupported image-type ({job_image_type}")
             return t_compose, TestResult.FAILED
 
-        expected_exit_code: int = job_definition.tests[job_test_name].checks.exitCode
+        expected_exit_code: int = job_test.checks.exitCode
 
         if exit_code != expected_exit_code:
             print("! FAILURE")
             print(
                 f"! exit_code={exit_code}" f" expected_exit_code={expected_exit_code}"
             )
+            if output_limit is not None:
+                print(f"! (only the last {output_limit} bytes of output are shown)")
             print("! Test stdout follows...")
-            print(out)
+            print(_decode_output(out))
             print("! Test stderr follows...")
-            print(err)
+            print(_decode_output(err))
             return t_compose, TestResult.FAILED
 
         if args.verbose:
-            print(out)
+            print(_decode_output(out))
 
     # Inspect the results
     # (only if successful so far)
-    if not args.dry_run and job_definition.tests[job_test_name].checks.outputs:
-        assert t_compose
+    if not args.dry_run and job_test.checks.outputs:
         if not _check(
             t_compose,
-            job_definition.tests[job_test_name].checks.outputs,
+            job_test.checks.outputs,
             job_image_fix_permissions,
         ):
             return t_compose, TestResult.FAILED
@@ -882,38 +1217,19 @@ def _run_a_test(
     return t_compose, TestResult.PASSED
 
 
-def _run_ungrouped_tests(
+def _run_ungrouped_test(
     args: argparse.Namespace,
-    filename: str,
-    collection: str,
-    job: str,
-    job_definition: DefaultMunch,
-) -> Tuple[int, int, int, int]:
-    """Runs the tests for a specific Job definition returning the number
-    of tests passed, skipped (due to run-level), ignored and failed.
+    thread_output: _ThreadOutput,
+    ungrouped_test: _UngroupedTest,
+) -> Tuple[TestResult, str]:
+    """Runs a single (ungrouped) test, cleaning up if it passes.
+    This is run from a worker thread so the test's output is collected
+    and returned (with the test result) rather than printed.
     """
-    assert job_definition
-    assert isinstance(job_definition, DefaultMunch)
+    filename, collection, job, job_test_name, job_definition = ungrouped_test
 
-    # The test status, assume success
-    tests_passed: int = 0
-    tests_skipped: int = 0
-    tests_ignored: int = 0
-    tests_failed: int = 0
-
-    for job_test_name in job_definition.tests:
-        # If a job test has been named,
-        # skip this test if it doesn't match.
-        # We do not include this test in the count.
-        if args.test and not args.test == job_test_name:
-            continue
-
-        # If the test is part of a group then skip it.
-        # We only run ungrouped tests here.
-        if "run-groups" in job_definition.tests[job_test_name]:
-            continue
-
-        # Now run the test...
+    thread_output.start()
+    try:
         compose, test_result = _run_a_test(
             args,
             filename,
@@ -924,20 +1240,89 @@ def _run_ungrouped_tests(
         )
 
         # Clean-up?
+        # The test's directory is removed in the background,
+        # there's no need to wait for it before we run the next test.
         if test_result == TestResult.PASSED and not args.keep_results:
             assert compose
-            compose.delete()
+            compose.delete(background=True)
 
-        # Count?
         if test_result == TestResult.PASSED:
             print("- SUCCESS")
-            tests_passed += 1
-        elif test_result == TestResult.FAILED:
-            tests_failed += 1
+    finally:
+        output: str = thread_output.stop()
 
-        # Told to stop on first failure?
-        if test_result == TestResult.FAILED and args.exit_on_failure:
-            break
+    return test_result, output
+
+
+def _run_ungrouped_tests(
+    args: argparse.Namespace,
+    ungrouped_tests: List[_UngroupedTest],
+) -> Tuple[int, int, int, int]:
+    """Runs the ungrouped tests returning the number of tests passed,
+    skipped (due to run-level), ignored and failed.
+
+    Ungrouped tests are independent of each other so they're run concurrently,
+    using a pool of threads (each test spends most of its time waiting for
+    its container). The output of each test is printed as the test finishes.
+    """
+    # The test status, assume success
+    tests_passed: int = 0
+    tests_skipped: int = 0
+    tests_ignored: int = 0
+    tests_failed: int = 0
+
+    if not ungrouped_tests:
+        return tests_passed, tests_skipped, tests_ignored, tests_failed
+
+    thread_output: _ThreadOutput = _ThreadOutput(sys.stdout)
+    with contextlib.redirect_stdout(thread_output):
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            futures: List[Future[Tuple[TestResult, str]]] = [
+                executor.submit(
+                    _run_ungrouped_test, args, thread_output, ungrouped_test
+                )
+                for ungrouped_test in ungrouped_tests
+            ]
+            stopping: bool = False
+            try:
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    test_result, output = future.result()
+                    print(output, end="")
+
+                    # Count?
+                    if test_result == TestResult.PASSED:
+                        tests_passed += 1
+                    elif test_result == TestResult.SKIPPED:
+                        tests_skipped += 1
+                    elif test_result == TestResult.IGNORED:
+                        tests_ignored += 1
+                    elif test_result == TestResult.FAILED:
+                        tests_failed += 1
+
+                    # Told to stop on first failure?
+                    # Tests that have not started are abandoned
+                    # but those that are running are allowed to finish,
+                    # and are reported (and counted) like any other.
+                    if (
+                        test_result == TestResult.FAILED
+                        and args.exit_on_failure
+                        and not stopping
+                    ):
+                        stopping = True
+                        for pending_future in futures:
+                            _ = pending_future.cancel()
+            except BaseException as ex:
+                # Interrupted (or a test has crashed).
+                # Abandon the tests that have not started
+                # rather than wait for them all to be run (and their output lost).
+                executor.shutdown(wait=False, cancel_futures=True)
+                if isinstance(ex, KeyboardInterrupt):
+                    # The running tests' commands don't see a Ctrl-C,
+                    # pass it on so we're not left waiting for them.
+                    interrupt_running_commands()
+                raise
 
     return tests_passed, tests_skipped, tests_ignored, tests_failed
 
@@ -1060,6 +1445,8 @@ def _run_grouped_tests(
             # 2. run the tests (in ordinal order)
             # 3. stop the compose file
             group_compose_file: Optional[str] = None
+            # The tests (compose instances) of the group that have been run.
+            group_composes: List[Compose] = []
             for index, grouped_test in enumerate(grouped_tests):
                 # For each grouped test we have a test-group definition [at index 0],
                 # an 'ordinal' [1], 'collection' [2], 'job name' [3], 'job test' [4]
@@ -1106,10 +1493,10 @@ def _run_grouped_tests(
                     test_group_environment=test_group_environment,
                 )
 
-                # Always try and teardown the test compose
-                # between tests in a group.
-                if compose and not args.keep_results:
-                    compose.delete()
+                # The test's (compose) material is removed
+                # at the end of the group.
+                if compose:
+                    group_composes.append(compose)
 
                 # And stop if any test has failed.
                 if test_result == TestResult.FAILED:
@@ -1128,6 +1515,14 @@ def _run_grouped_tests(
             if group_compose_file and not args.dry_run:
                 _ = Compose.stop_group_compose_file(group_compose_file)
 
+            # Always take down the project the group's tests shared
+            # (and its network) and then teardown each test.
+            if group_composes and not args.dry_run:
+                group_composes[-1].stop_group_project()
+            if not args.keep_results:
+                for group_compose in group_composes:
+                    group_compose.delete(background=True)
+
             # Told to exit on first failure?
             if test_result == TestResult.FAILED and args.exit_on_failure:
                 break
@@ -1139,10 +1534,68 @@ def _run_grouped_tests(
     return tests_passed, tests_skipped, tests_ignored, tests_failed
 
 
+def _is_test_to_run(
+    args: argparse.Namespace,
+    job_name: str,
+    job_test_name: str,
+    job_test: DefaultMunch,
+) -> bool:
+    """Returns True if a test is one that we're going to run.
+    It applies the same filters as the test loops and '_run_a_test()'
+    (any collection filter is expected to have been applied).
+    """
+    if "run-groups" in job_test:
+        # Grouped tests are only filtered by a named run group
+        if args.run_group and not any(
+            run_group.name == args.run_group for run_group in job_test["run-groups"]
+        ):
+            return False
+    elif (
+        args.run_group
+        or (args.job and not args.job == job_name)
+        or (args.test and not args.test == job_test_name)
+    ):
+        return False
+    # Ignored (and run-level) tests are run if a test has been named
+    if args.test:
+        return True
+    if "ignore" in job_test:
+        return False
+    return not ("run-level" in job_test and job_test["run-level"] > args.run_level)
+
+
+def _get_test_images(
+    args: argparse.Namespace, job_definitions: List[DefaultMunch]
+) -> List[str]:
+    """Returns the (unique) container images of the Jobs that have tests
+    that we're going to run (i.e. those that match any collection, Job, test
+    or run group we've been given and are not ignored or skipped).
+    Nextflow Jobs are excluded as they're not run in their image.
+    """
+    images: Set[str] = set()
+    for job_definition in job_definitions:
+        if args.collection and not args.collection == job_definition.collection:
+            continue
+        for job_name in job_definition.jobs:
+            job: DefaultMunch = job_definition.jobs[job_name]
+            if not job.tests:
+                continue
+            if "type" in job.image and job.image["type"].lower() != _IMAGE_TYPE_SIMPLE:
+                continue
+            if not any(
+                _is_test_to_run(args, job_name, job_test_name, job_test)
+                for job_test_name, job_test in job.tests.items()
+            ):
+                continue
+            tag: str = args.image_tag or job.image.tag
+            images.add(f"{job.image.name}:{tag}")
+    return sorted(images)
+
+
 def _wipe() -> None:
     """Wipes the results of all tests."""
     test_root: str = get_test_root()
-    if os.path.isdir(test_root):
+    with contextlib.suppress(FileNotFoundError):
         shutil.rmtree(test_root)
 
 
@@ -1156,6 +1609,14 @@ def arg_check_run_level(value: str) -> int:
     return i_value
 
 
+def arg_check_jobs(value: str) -> int:
+    """A type checker for the argparse jobs."""
+    i_value = int(value)
+    if i_value < 1:
+        raise argparse.ArgumentTypeError("Minimum value is 1")
+    return i_value
+
+
 def arg_check_run_as_user(value: str) -> int:
     """A type checker for the argparse run-as-user."""
     i_value = int(value)
@@ -1239,6 +1700,16 @@ def main() -> int:
         " containers.",
         type=arg_check_run_as_user,
     )
+    arg_parser.add_argument(
+        "-J",
+        "--jobs",
+        help="The number of tests that can be run at the same time."
+        " Tests that belong to a run-group are always run one at a time."
+        f" If not set {_DEFAULT_TEST_WORKERS} is used"
+        " (the number of CPU cores, less two).",
+        default=_DEFAULT_TEST_WORKERS,
+        type=arg_check_jobs,
+    )
 
     arg_parser.add_argument(
         "-d",
@@ -1261,6 +1732,16 @@ def main() -> int:
         " successful",
     )
 
+    arg_parser.add_argument(
+        "--link-inputs",
+        action="store_true",
+        help="Normally jote copies each test's input files"
+        " into the test's directory. Setting this flag"
+        " hard-links them instead (where the file-system allows),"
+        " which avoids copying large inputs. Only use this"
+        " if your jobs do not modify their input files.",
+    )
+
     arg_parser.add_argument(
         "-v",
         "--verbose",
@@ -1357,7 +1838,7 @@ def main() -> int:
 
     # Load all the files we can and then run the tests.
     job_definitions, grouped_job_definitions, num_tests = _load(
-        args.manifest, args.skip_lint
+        args.manifest, args.skip_lint, args.collection
     )
     if num_tests < 0:
         print("! FAILURE")
@@ -1375,11 +1856,23 @@ def main() -> int:
     if args.run_group:
         print(f'# Limiting to Run Group "{args.run_group}"')
 
+    # Pull the test images (concurrently) before running any tests.
+    # An image that's not available fails the tests that use it.
+    if not args.dry_run:
+        missing_images: List[str] = pull_images(
+            _get_test_images(args, job_definitions), args.jobs
+        )
+        for missing_image in missing_images:
+            print(f"W Test image is not available ({missing_image})")
+        _UNAVAILABLE_IMAGES.update(missing_images)
+
     # Run ungrouped tests (unless a test group has been named)
     if not args.run_group and job_definitions:
         # We've not been told to run a test group and have at least one job-definition
         # that has a test that does not need a group.
-        # These tests can be run in any order.
+        # These tests can be run in any order, so we collect them
+        # and then run them together.
+        ungrouped_tests: List[_UngroupedTest] = []
         for job_definition in job_definitions:
             # If a collection's been named,
             # skip this file if it's not the named collection
@@ -1393,37 +1886,47 @@ def main() -> int:
                 if args.job and not args.job == job_name:
                     continue
 
-                # Skip any test that has a run-group defined.
-                # These will be handled sepratately.
-                if job_definition.jobs[job_name].tests:
-                    (
-                        num_passed,
-                        num_skipped,
-                        num_ignored,
-                        num_failed,
-                    ) = _run_ungrouped_tests(
-                        args,
-                        job_definition.definition_filename,
-                        collection,
-                        job_name,
-                        job_definition.jobs[job_name],
+                if not job_definition.jobs[job_name].tests:
+                    continue
+                for job_test_name in job_definition.jobs[job_name].tests:
+                    # If a job test has been named,
+                    # skip this test if it doesn't match.
+                    # We do not include this test in the count.
+                    if args.test and not args.test == job_test_name:
+                        continue
+
+                    # Skip any test that has a run-group defined.
+                    # These will be handled separately.
+                    if (
+                        "run-groups"
+                        in job_definition.jobs[job_name].tests[job_test_name]
+                    ):
+                        continue
+
+                    ungrouped_tests.append(
+                        (
+                            job_definition.definition_filename,
+                            collection,
+                            job_name,
+                            job_test_name,
+                            job_definition.jobs[job_name],
+                        )
                     )
-                    total_passed_count += num_passed
-                    total_skipped_count += num_skipped
-                    total_ignore_count += num_ignored
-                    total_failed_count += num_failed
 
-                    # Break out of this loop if told to stop on failures
-                    if num_failed > 0 and args.exit_on_failure:
-                        break
-
-            # Break out of this loop if told to stop on failures
-            if total_failed_count > 0 and args.exit_on_failure:
-                break
+        (
+            num_passed,
+            num_skipped,
+            num_ignored,
+            num_failed,
+        ) = _run_ungrouped_tests(args, ungrouped_tests)
+        total_passed_count += num_passed
+        total_skipped_count += num_skipped
+        total_ignore_count += num_ignored
+        total_failed_count += num_failed
 
-    # Success so far.
     # Run grouped tests?
-    if grouped_job_definitions:
+    # Not if a test has failed and we've been told to exit on failure.
+    if grouped_job_definitions and not (total_failed_count and args.exit_on_failure):
         num_passed, num_skipped, num_ignored, num_failed = _run_grouped_tests(
             args,
             grouped_job_definitions,
@@ -1433,6 +1936,9 @@ def main() -> int:
         total_ignore_count += num_ignored
         total_failed_count += num_failed
 
+    # Test directories may still be being deleted.
+    wait_for_deletions()
+
     # Success or failure?
     # It's an error to find no tests.
     print("  ---")
@@ -0,0 +1,155 @@
+"""Tests for the 'compose' module."""
+
+import contextlib
+import io
+import signal
+import subprocess
+import threading
+import time
+import unittest
+import unittest.mock
+from typing import List, Tuple
+
+from jote import compose
+from jote.compose import Compose, interrupt_running_commands, run_captured
+
+
+class RunCapturedTest(unittest.TestCase):
+    """Tests for 'run_captured()'."""
+
+    def test_output_and_exit_code(self) -> None:
+        """The exit code, stdout and stderr are returned."""
+        exit_code, stdout, stderr = run_captured(
+            "echo out; echo err >&2; exit 3", shell=True, timeout=10
+        )
+        self.assertEqual(exit_code, 3)
+        self.assertEqual(stdout, b"out\n")
+        self.assertEqual(stderr, b"err\n")
+
+    def test_output_limit(self) -> None:
+        """Only the last 'output_limit' bytes are returned."""
+        _, stdout, _ = run_captured(["echo", "0123456789"], timeout=10, output_limit=4)
+        self.assertEqual(stdout, b"789\n")
+
+    def test_timeout_with_child_process(self) -> None:
+        """The timeout holds when the command's children keep its output open,
+        i.e. a shell that's running another command."""
+        start = time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            _ = run_captured("sleep 8; echo done", shell=True, timeout=1)
+        self.assertLess(time.monotonic() - start, 4)
+
+    def test_interrupt_running_commands(self) -> None:
+        """Commands run by other threads can be interrupted."""
+        results: List[Tuple[int, bytes, bytes]] = []
+        runner = threading.Thread(
+            target=lambda: results.append(
+                run_captured("sleep 8; echo done", shell=True, timeout=30)
+            )
+        )
+        start = time.monotonic()
+        runner.start()
+        # pylint: disable=protected-access
+        while not compose._RUNNING_PROCESS_GROUPS and runner.is_alive():
+            time.sleep(0.01)
+        interrupt_running_commands()
+        runner.join()
+        self.assertLess(time.monotonic() - start, 4)
+        self.assertEqual(results[0][0], -signal.SIGINT)
+        self.assertEqual(results[0][1], b"")
+
+
+class InterpolateTest(unittest.TestCase):
+    """Tests for '_interpolate()', which must match compose's interpolation."""
+
+    environment = {"SET": "value", "EMPTY": ""}
+
+    def interpolate(self, text: str) -> str:
+        """Interpolates the text using the test environment."""
+        # pylint: disable=protected-access
+        interpolated: str = compose._interpolate(text, self.environment)
+        return interpolated
+
+    def test_variables(self) -> None:
+        """Named and braced variables are substituted, unset ones are empty."""
+        self.assertEqual(self.interpolate("a $SET ${SET}b"), "a value valueb")
+        self.assertEqual(self.interpolate("[$UNSET][${UNSET}]"), "[][]")
+
+    def test_escaped_dollar(self) -> None:
+        """'$$' is a literal '$'."""
+        self.assertEqual(self.interpolate("echo $$SET $$$SET"), "echo $SET $value")
+
+    def test_defaults_and_alternatives(self) -> None:
+        """':-' and ':+' treat an empty variable as unset, '-' and '+' do not."""
+        self.assertEqual(self.interpolate("${UNSET:-d} ${EMPTY:-d}"), "d d")
+        self.assertEqual(self.interpolate("${UNSET-d} [${EMPTY-d}]"), "d []")
+        self.assertEqual(self.interpolate("[${UNSET:+a}] [${EMPTY:+a}]"), "[] []")
+        self.assertEqual(self.interpolate("${SET:+a} ${EMPTY+a}"), "a a")
+
+    def test_errors(self) -> None:
+        """Missing required variables and invalid references are errors."""
+        self.assertEqual(self.interpolate("${SET:?gone}"), "value")
+        self.assertEqual(self.interpolate("${EMPTY?gone}"), "")
+        for text in ("${EMPTY:?gone}", "${UNSET?gone}", "cost $5", "${SET"):
+            with self.assertRaises(ValueError, msg=text):
+                _ = self.interpolate(text)
+
+
+class RunCommandTest(unittest.TestCase):
+    """Tests for the 'docker run' command used for ungrouped tests."""
+
+    def test_values_are_interpolated(self) -> None:
+        """The command and environment are interpolated as compose would,
+        from the test environment and then our own."""
+        # (so that docker compose is not needed)
+        with unittest.mock.patch.object(
+            Compose, "_COMPOSE_COMMAND", "docker compose"
+        ), unittest.mock.patch.object(Compose, "_COMPOSE_VERSION", "2"):
+            test_compose = Compose(
+                "collection",
+                "job",
+                "test",
+                "image:1.0",
+                "simple",
+                "1Gi",
+                1,
+                "/data",
+                "/data",
+                "sh -c 'echo $$HOME ${GREETING:-hi} $$1'",
+                {"GREETING": "hello", "MESSAGE": "$GREETING from $USER"},
+                user_id=1000,
+                group_id=1000,
+            )
+        with unittest.mock.patch.dict("os.environ", {"USER": "jote"}):
+            # pylint: disable=protected-access
+            run_cmd = test_compose._get_run_command()
+        self.assertIn("MESSAGE=hello from jote", run_cmd)
+        self.assertEqual(run_cmd[run_cmd.index("--entrypoint") + 1], "sh")
+        self.assertEqual(
+            run_cmd[run_cmd.index("image:1.0") :],
+            ["image:1.0", "-c", "echo $HOME hello $1"],
+        )
+
+
+class DeletionTest(unittest.TestCase):
+    """Tests for the background deletion of test directories."""
+
+    def test_error_is_reported_when_waited_on(self) -> None:
+        """A failed deletion is reported, not lost with its thread."""
+        # pylint: disable=protected-access
+        deletion = compose._Deletion("/no/such/test")
+        with unittest.mock.patch(
+            "shutil.rmtree", side_effect=PermissionError("not allowed")
+        ):
+            deletion.start()
+            deletion.join()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            deletion.wait()
+        self.assertIn(
+            'delete the test ("/no/such/test"): not allowed', output.getvalue()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
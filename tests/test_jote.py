@@ -0,0 +1,240 @@
+"""Tests for the 'jote' module."""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Tuple
+from unittest import mock
+
+from jote import jote
+
+
+def _text_mode_line_count(path: str) -> int:
+    """Counts lines the way jote originally did (text mode, universal newlines)."""
+    line_count: int = 0
+    with open(path, "rt", encoding="UTF-8") as check_file:
+        for _ in check_file:
+            line_count += 1
+    return line_count
+
+
+class CountLinesTest(unittest.TestCase):
+    """Tests for '_count_lines()'."""
+
+    CONTENT = [
+        b"",
+        b"one",
+        b"one\n",
+        b"one\ntwo",
+        b"one\ntwo\n",
+        b"one\r\ntwo\r\n",
+        b"one\rtwo\rthree",
+        b"one\rtwo\r",
+        b"one\r\rtwo\n\n",
+        b"one\r\ntwo\rthree\nfour",
+        b"\r\n\r\n\r",
+    ]
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "output.txt")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _write(self, content: bytes) -> None:
+        with open(self.path, "wb") as output_file:
+            output_file.write(content)
+
+    def test_matches_text_mode(self) -> None:
+        """Line endings are counted as they are in text mode,
+        including old Mac ('\\r') line endings."""
+        for content in self.CONTENT:
+            with self.subTest(content=content):
+                self._write(content)
+                self.assertEqual(
+                    jote._count_lines(self.path),  # pylint: disable=protected-access
+                    _text_mode_line_count(self.path),
+                )
+
+    def test_matches_text_mode_across_blocks(self) -> None:
+        """A '\\r\\n' split between blocks is one line break."""
+        with mock.patch.object(jote, "_LINE_COUNT_BLOCK_SIZE", 4):
+            for content in self.CONTENT:
+                with self.subTest(content=content):
+                    self._write(content)
+                    self.assertEqual(
+                        jote._count_lines(  # pylint: disable=protected-access
+                            self.path
+                        ),
+                        _text_mode_line_count(self.path),
+                    )
+
+    def test_old_mac_line_endings(self) -> None:
+        """Lines that end with just '\\r' are counted."""
+        self._write(b"one\rtwo\rthree\r")
+        self.assertEqual(
+            jote._count_lines(self.path), 3  # pylint: disable=protected-access
+        )
+
+
+class GetDefinitionCollectionTest(unittest.TestCase):
+    """Tests for '_get_definition_collection()'."""
+
+    def collection(self, content: bytes) -> Any:
+        """Returns the collection found in the definition content."""
+        # pylint: disable=protected-access
+        return jote._get_definition_collection(
+            b"---\nkind: DataManagerJobDefinition\n" + content
+        )
+
+    def test_single_line_values(self) -> None:
+        """Plain and quoted single-line values are found."""
+        self.assertEqual(self.collection(b"collection: im-test\njobs: {}\n"), "im-test")
+        self.assertEqual(self.collection(b"collection: 'im-test' # x\n"), "im-test")
+        self.assertEqual(
+            self.collection(b'collection: "im-test"\r\njobs:\n'), "im-test"
+        )
+
+    def test_values_that_need_a_full_parse(self) -> None:
+        """Values that cannot be found from the line alone are not returned."""
+        for content in (
+            b"collection:\n  im-test\n",
+            b"collection: ''\n",
+            b"collection: |\n  im-test\n",
+            b"collection: >-\n  im-test\n",
+            b"collection: im\n  -test\n",
+            b"collection: 'im\n  -test'\n",
+            b'collection: "im-test\n',
+            b"collection: a\ncollection: b\n",
+        ):
+            self.assertIsNone(self.collection(content), msg=content)
+
+
+class StageInputTest(unittest.TestCase):
+    """Tests for '_stage_input()'."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.project_path = os.path.join(self.directory, "project")
+        os.mkdir(self.project_path)
+        self.test_input = os.path.join(self.directory, "script.sh")
+        with open(self.test_input, "wt", encoding="UTF-8") as input_file:
+            input_file.write("#!/bin/sh\n")
+        os.chmod(self.test_input, 0o750)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _stage(self, link: bool) -> os.stat_result:
+        jote._stage_input(  # pylint: disable=protected-access
+            self.test_input, self.project_path, link
+        )
+        return os.stat(os.path.join(self.project_path, "script.sh"))
+
+    def test_copy_keeps_permissions(self) -> None:
+        """A copied input keeps its permission bits (i.e. stays executable)."""
+        staged = self._stage(link=False)
+        self.assertNotEqual(staged.st_ino, os.stat(self.test_input).st_ino)
+        self.assertEqual(staged.st_mode & 0o777, 0o750)
+
+    def test_link(self) -> None:
+        """A linked input is the input file."""
+        staged = self._stage(link=True)
+        self.assertEqual(staged.st_ino, os.stat(self.test_input).st_ino)
+
+    def test_link_fallback_keeps_permissions(self) -> None:
+        """An input that cannot be linked is copied, keeping its permission bits."""
+        with mock.patch.object(jote.os, "link", side_effect=OSError):
+            staged = self._stage(link=True)
+        self.assertNotEqual(staged.st_ino, os.stat(self.test_input).st_ino)
+        self.assertEqual(staged.st_mode & 0o777, 0o750)
+
+
+class RunUngroupedTestsTest(unittest.TestCase):
+    """Tests for '_run_ungrouped_tests()'."""
+
+    def test_exit_on_failure_reports_running_tests(self) -> None:
+        """With '--exit-on-failure' every test that was running when the first
+        test failed is still reported and counted."""
+        args = argparse.Namespace(jobs=2, exit_on_failure=True)
+        tests: List[Any] = [
+            ("one.yaml", "coll-a", "job", test_name, None)
+            for test_name in ("t-fail", "t-fail2")
+        ]
+        # Both tests must be running before either fails
+        both_running = threading.Barrier(2, timeout=10)
+
+        def run_failing_test(
+            _args: argparse.Namespace, _thread_output: Any, ungrouped_test: Any
+        ) -> Tuple[jote.TestResult, str]:
+            both_running.wait()
+            return jote.TestResult.FAILED, f"! FAILURE {ungrouped_test[3]}\n"
+
+        output = io.StringIO()
+        with mock.patch.object(
+            jote, "_run_ungrouped_test", run_failing_test
+        ), contextlib.redirect_stdout(output):
+            results = jote._run_ungrouped_tests(  # pylint: disable=protected-access
+                args, tests
+            )
+
+        self.assertEqual(results, (0, 0, 0, 2))
+        self.assertIn("! FAILURE t-fail\n", output.getvalue())
+        self.assertIn("! FAILURE t-fail2\n", output.getvalue())
+
+    def test_crash_abandons_tests_not_started(self) -> None:
+        """A test that raises an exception stops the tests, the exception
+        is raised and tests that have not started are never started."""
+        args = argparse.Namespace(jobs=1, exit_on_failure=False)
+        tests: List[Any] = [
+            ("one.yaml", "coll-a", "job", test_name, None)
+            for test_name in ("t-crash", "t-two", "t-three")
+        ]
+        started_tests: List[str] = []
+        shutdown = threading.Event()
+
+        class _Executor(ThreadPoolExecutor):
+            """An executor that tells us when it's been shutdown."""
+
+            def shutdown(
+                self, wait: bool = True, *, cancel_futures: bool = False
+            ) -> None:
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+                shutdown.set()
+
+        def run_test(
+            _args: argparse.Namespace, _thread_output: Any, ungrouped_test: Any
+        ) -> Tuple[jote.TestResult, str]:
+            started_tests.append(ungrouped_test[3])
+            if ungrouped_test[3] == "t-crash":
+                raise RuntimeError("Crashed")
+            # A test may start before the crash is seen,
+            # it finishes once the executor's been shutdown.
+            shutdown.wait(timeout=5)
+            return jote.TestResult.PASSED, ""
+
+        with mock.patch.object(
+            jote, "_run_ungrouped_test", run_test
+        ), mock.patch.object(
+            jote, "ThreadPoolExecutor", _Executor
+        ), contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            with self.assertRaises(RuntimeError):
+                _ = jote._run_ungrouped_tests(  # pylint: disable=protected-access
+                    args, tests
+                )
+
+        self.assertIn("t-crash", started_tests)
+        self.assertNotIn("t-three", started_tests)
+
+
+if __name__ == "__main__":
+    unittest.main()